@@ -18,6 +18,9 @@ import yaml
 import json
 import glob
 
+# Used to compare configs independently of key order.
+_sortedEncoder = json.JSONEncoder( sort_keys = True )
+
 class LcConfigException( Exception ):
     pass
 
@@ -103,7 +106,9 @@ class Configs( object ):
         return rule
 
     def _isJsonEqual( self, a, b ):
-        if json.dumps( a, sort_keys = True ) != json.dumps( b, sort_keys = True ):
+        if a is b:
+            return True
+        if _sortedEncoder.encode( a ) != _sortedEncoder.encode( b ):
             return False
 
         return True
@@ -57,8 +57,10 @@ class Extension( object ):
             'gzdata' : base64.b64encode( gzip.compress( json.dumps( data ).encode() ) ),
         }
         if isImpersonated:
-            if self._manager._jwt is None:
-                self._manager._refreshJWT()
+            # The JWT is handed over to the extension, so do not pass
+            # along a cached one that may be close to expiring.
+            if self._manager._jwt is None or self._manager._secret_api_key is not None:
+                self._manager._refreshJWT( isForceRefresh = True )
             req[ 'impersonator_jwt' ] = self._manager._jwt
         return self._manager._apiCall( 'extension/request/%s' % ( extName, ), POST, req )
     
@@ -211,18 +211,20 @@ class Firehose( object ):
                 data = sock.recv( 1024 * 512 )
                 if not data: break
 
-                chunks = [ c for c in data.split( b'\n' ) ]
+                chunks = data.split( b'\n' )
 
                 # This is a pure continuation.
                 if 1 == len( chunks ):
                     curData.append( chunks[ 0 ] )
                     continue
 
-                # Every chunk is an event boundary.
-                for c in chunks:
-                    curData.append( c )
-                    buff = b''.join( curData )
-                    curData = []
+                # Every chunk but the last one ends at an event boundary,
+                # the last one is the start of the next event so it is
+                # kept for the next recv() instead of being parsed now.
+                curData.append( chunks[ 0 ] )
+                chunks[ 0 ] = b''.join( curData )
+                curData = [ chunks.pop() ]
+                for buff in chunks:
                     if 0 == len( buff ):
                         continue
                     try:
@@ -5,18 +5,14 @@ if sys.version_info[ 0 ] < 3:
     _IS_PYTHON_2 = True
 
 if _IS_PYTHON_2:
-    from urllib2 import HTTPError
-    from urllib2 import Request as URLRequest
-    from urllib2 import urlopen
     from urllib import urlencode
     from urllib import quote as urlescape
 else:
-    from urllib.error import HTTPError
-    from urllib.request import Request as URLRequest
-    from urllib.request import urlopen
     from urllib.parse import urlencode
     from urllib.parse import quote as urlescape
 
+import requests
+from requests.adapters import HTTPAdapter
 import uuid
 import json
 import traceback
@@ -24,6 +20,9 @@ import cmd
 import zlib
 import base64
 import time
+import ssl
+import threading
+import hashlib
 from functools import wraps
 
 from .Sensor import Sensor
@@ -45,11 +44,38 @@ API_VERSION = 'v1'
 
 API_TO_JWT_URL = 'https://jwt.limacharlie.io'
 
+USER_AGENT = 'lc-py-api'
+
 HTTP_UNAUTHORIZED = 401
+HTTP_FORBIDDEN = 403
 HTTP_TOO_MANY_REQUESTS = 429
 HTTP_GATEWAY_TIMEOUT = 504
 HTTP_OK = 200
 
+# Size of the keep-alive connection pool used per host by a Manager.
+# Retries are handled by _apiCall() so the adapter does not retry itself.
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 10
+
+# JWTs minted from API keys are cached for the process and shared by
+# all Manager instances with the same credentials:
+# ( oid, uid, sha256( secret_api_key ), expiry ) => ( jwt, expiry_epoch )
+# A cached JWT is not re-used once it is within the margin of expiring,
+# and expired entries are dropped whenever a new JWT is stored.
+JWT_CACHE_SAFETY_MARGIN = 60
+_jwtCache = {}
+_jwtCacheLock = threading.Lock()
+
+def _getJWTExpiry( jwt ):
+    # The "exp" claim is read from the JWT payload without verifying
+    # the signature, it is only used to know when to mint a new one.
+    try:
+        payload = jwt.split( '.' )[ 1 ]
+        payload += '=' * ( -len( payload ) % 4 )
+        return float( json.loads( base64.urlsafe_b64decode( payload.encode() ).decode() )[ 'exp' ] )
+    except Exception:
+        return None
+
 class Manager( object ):
     '''General interface to a limacharlie.io Organization.'''
 
@@ -104,6 +130,7 @@ class Manager( object ):
         self._onRefreshAuth = onRefreshAuth
         self._secret_api_key = secret_api_key
         self._jwt = jwt
+        self._isJWTFromCache = False
         self._debug = print_debug_fn
         self._lastSensorListContinuationToken = None
         self._inv_id = inv_id
@@ -111,6 +138,7 @@ class Manager( object ):
         self._is_interactive = is_interactive
         self._extra_params = extra_params
         self._isRetryQuotaErrors = isRetryQuotaErrors
+        self._session = self._newSession()
         if self._is_interactive:
             if not self._inv_id:
                 raise LcApiException( 'Investigation ID must be set for interactive mode to be enabled.' )
@@ -134,7 +162,39 @@ class Manager( object ):
         if self._debug is not None:
             self._debug( msg )
 
-    def _refreshJWT( self, expiry = None ):
+    def _newSession( self ):
+        # All REST calls go through a single Session so that the TCP and
+        # TLS connections to the API are kept alive and re-used.
+        session = requests.Session()
+        session.headers[ 'User-Agent' ] = USER_AGENT
+        # requests verifies against the certifi bundle by default, keep
+        # verifying against the system trust store like urlopen() did.
+        verifyPaths = ssl.get_default_verify_paths()
+        if verifyPaths.cafile is not None:
+            session.verify = verifyPaths.cafile
+        elif verifyPaths.capath is not None:
+            session.verify = verifyPaths.capath
+        adapter = HTTPAdapter( pool_connections = HTTP_POOL_CONNECTIONS,
+                               pool_maxsize = HTTP_POOL_MAXSIZE )
+        session.mount( 'https://', adapter )
+        session.mount( 'http://', adapter )
+        return session
+
+    def _refreshJWT( self, expiry = None, isForceRefresh = False ):
+        cacheKey = None
+        if self._secret_api_key is not None:
+            cacheKey = ( self._oid, self._uid, hashlib.sha256( self._secret_api_key.encode() ).hexdigest(), expiry )
+        if cacheKey is not None and not isForceRefresh:
+            with _jwtCacheLock:
+                cached = _jwtCache.get( cacheKey, None )
+                if cached is not None and JWT_CACHE_SAFETY_MARGIN >= cached[ 1 ] - time.time():
+                    del _jwtCache[ cacheKey ]
+                    cached = None
+            if cached is not None:
+                self._jwt = cached[ 0 ]
+                self._isJWTFromCache = True
+                return
+        self._isJWTFromCache = False
         try:
             if self._secret_api_key is None:
                 raise Exception( 'No API key set' )
@@ -145,57 +205,67 @@ class Manager( object ):
                 authData[ 'oid' ] = self._oid
             if expiry is not None:
                 authData[ 'expiry' ] = int( expiry )
-            request = URLRequest( API_TO_JWT_URL,
-                                  urlencode( authData ).encode(),
-                                  headers = { "Content-Type": "application/x-www-form-urlencoded" } )
-            request.get_method = lambda: "POST"
-            u = urlopen( request )
-            self._jwt = json.loads( u.read().decode() )[ 'jwt' ]
-            u.close()
+            u = self._session.post( API_TO_JWT_URL,
+                                    data = urlencode( authData ).encode(),
+                                    headers = { "Content-Type": "application/x-www-form-urlencoded" } )
+            u.raise_for_status()
+            self._jwt = json.loads( u.content.decode() )[ 'jwt' ]
         except Exception as e:
             self._jwt = None
+            if cacheKey is not None:
+                with _jwtCacheLock:
+                    _jwtCache.pop( cacheKey, None )
             raise LcApiException( 'Failed to get JWT from API key oid=%s uid=%s: %s' % ( self._oid, self._uid, e, ) )
 
+        expiresAt = _getJWTExpiry( self._jwt )
+        if expiresAt is not None:
+            with _jwtCacheLock:
+                now = time.time()
+                for k in [ k for k, v in _jwtCache.items() if v[ 1 ] <= now ]:
+                    del _jwtCache[ k ]
+                _jwtCache[ cacheKey ] = ( self._jwt, expiresAt )
+
     def _restCall( self, url, verb, params, altRoot = None, queryParams = None, rawBody = None, contentType = None, isNoAuth = False, timeout = None ):
-        try:
-            resp = None
-            if not isNoAuth:
-                headers = { "Authorization" : "bearer %s" % self._jwt }
-            else:
-                headers = {}
+        resp = None
+        if not isNoAuth:
+            headers = { "Authorization" : "bearer %s" % self._jwt }
+        else:
+            headers = {}
 
-            if altRoot is None:
-                url = '%s/%s/%s' % ( ROOT_URL, API_VERSION, url )
-            else:
-                url = '%s/%s' % ( altRoot, url )
-
-            if queryParams is not None:
-                url = '%s?%s' % ( url, urlencode( queryParams ) )
-
-            request = URLRequest( url,
-                                  rawBody if rawBody is not None else urlencode( params, doseq = True ).encode(),
-                                  headers = headers )
-            request.get_method = lambda: verb
-            request.add_header( 'User-Agent', 'lc-py-api' )
-            if contentType is not None:
-                request.add_header( 'Content-Type', contentType )
-            u = urlopen( request, timeout = timeout )
+        if altRoot is None:
+            url = '%s/%s/%s' % ( ROOT_URL, API_VERSION, url )
+        else:
+            url = '%s/%s' % ( altRoot, url )
+
+        if queryParams is not None:
+            url = '%s?%s' % ( url, urlencode( queryParams ) )
+
+        if contentType is not None:
+            headers[ 'Content-Type' ] = contentType
+        else:
+            headers[ 'Content-Type' ] = 'application/x-www-form-urlencoded'
+
+        u = self._session.request( verb,
+                                   url,
+                                   data = rawBody if rawBody is not None else urlencode( params, doseq = True ).encode(),
+                                   headers = headers,
+                                   timeout = timeout )
+        if 200 <= u.status_code < 300:
             try:
-                data = u.read()
+                data = u.content
                 if 0 != len( data ):
                     resp = json.loads( data.decode() )
                 else:
                     resp = {}
             except ValueError as e:
                 LcApiException( "Failed to decode data from API: %s" % e )
-            u.close()
             ret = ( 200, resp )
-        except HTTPError as e:
-            errorBody = e.read()
+        else:
+            errorBody = u.content
             try:
-                ret = ( e.getcode(), json.loads( errorBody.decode() ) )
+                ret = ( u.status_code, json.loads( errorBody.decode() ) )
             except:
-                ret = ( e.getcode(), errorBody )
+                ret = ( u.status_code, errorBody )
 
         self._printDebug( "%s: %s ( %s ) ==> %s ( %s )" % ( verb, url, str( params ), ret[ 0 ], str( ret[ 1 ] ) ) )
 
@@ -222,17 +292,25 @@ class Manager( object ):
                     # We already renewed the JWT once.
                     break
                 elif not isNoAuth:
-                    # Do our one JWT renew attempt.
+                    # Do our one JWT renew attempt, the current JWT
+                    # was rejected so do not re-use a cached one.
                     hasAuthRefreshed = True
                     if self._onRefreshAuth is not None:
                         self._onRefreshAuth( self )
                     else:
-                        self._refreshJWT()
+                        self._refreshJWT( isForceRefresh = True )
                     continue
                 else:
                     # Auth failed, can't renew.
                     break
 
+            if code == HTTP_FORBIDDEN and self._isJWTFromCache and not hasAuthRefreshed:
+                # The cached JWT may predate a permission change on
+                # the API key, get a fresh one before trusting a 403.
+                hasAuthRefreshed = True
+                self._refreshJWT( isForceRefresh = True )
+                continue
+
             if code == HTTP_TOO_MANY_REQUESTS and self._isRetryQuotaErrors:
                 # Out of quota, wait a bit and retry.
                 time.sleep( 10 )
@@ -257,6 +335,8 @@ class Manager( object ):
         if self._spout is not None:
             self._spout.shutdown()
             self._spout = None
+        # Release the pooled keep-alive connections to the API.
+        self._session.close()
 
     def make_interactive( self ):
         '''Enables interactive mode on this instance if it was not created with is_interactive.
@@ -282,13 +362,14 @@ class Manager( object ):
         try:
             perms = None
 
-            # First make sure we have an API key or JWT.
+            # First make sure we have an API key or JWT. The key is
+            # validated against the API, not against the JWT cache.
             if self._secret_api_key is not None:
                 try:
                     if self._onRefreshAuth is not None:
                         self._onRefreshAuth( self )
                     else:
-                        self._refreshJWT()
+                        self._refreshJWT( isForceRefresh = True )
                 except:
                     return False
             elif self._jwt is not None:
@@ -894,7 +975,7 @@ class Manager( object ):
         if isImpersonate:
             # To make sure we have as fresh a JWT as possible,
             # always do a refresh.
-            self._refreshJWT()
+            self._refreshJWT( isForceRefresh = True )
             req[ 'jwt' ] = self._jwt
         data = self._apiCall( 'service/%s/%s' % ( self._oid, serviceName ), POST, req )
         return data
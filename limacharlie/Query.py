@@ -1,4 +1,3 @@
-from functools import cache
 from . import Manager
 from .Replay import Replay
 import json
@@ -18,6 +17,16 @@ except ImportError:
 
 from .utils import Spinner
 
+# All pretty-printed output uses the same settings, so the encoder is
+# built once instead of on every json.dumps() call.
+_prettyEncoder = json.JSONEncoder( indent = 2 )
+
+def _prettyJson( data ):
+    # Empty stats and nested columns are common, skip the encoder.
+    if isinstance( data, dict ) and 0 == len( data ):
+        return '{}'
+    return _prettyEncoder.encode( data )
+
 def main( sourceArgs = None ):
     import argparse
 
@@ -92,7 +101,7 @@ def main( sourceArgs = None ):
         return
     for result in response[ 'results' ]:
         if args.isPretty:
-            print( json.dumps( result[ 'data' ], indent = 2 ) )
+            print( _prettyJson( result[ 'data' ] ) )
         else:
             print( json.dumps( result[ 'data' ] ) )
 
@@ -225,9 +234,9 @@ class LCQuery( cmd.Cmd ):
     def _outputPage( self, toRender ):
         if self._format == 'json':
             if pydoc is None:
-                self._logOutput( "\n".join( json.dumps( d, indent = 2 ) for d in toRender ) )
+                self._logOutput( "\n".join( _prettyJson( d ) for d in toRender ) )
             else:
-                dat = "\n".join( json.dumps( d, indent = 2 ) for d in toRender )
+                dat = "\n".join( _prettyJson( d ) for d in toRender )
                 self._logOutput( dat, isNoPrint = True )
                 pydoc.pager( dat )
         elif self._format == 'table':
@@ -245,7 +254,7 @@ class LCQuery( cmd.Cmd ):
 
     def _formatCol( self, col ):
         if isinstance( col, dict ):
-            return json.dumps( col, indent = 2 )
+            return _prettyJson( col )
         return col
 
     def do_n( self, inp ):
@@ -294,7 +303,7 @@ class LCQuery( cmd.Cmd ):
         thisBilled = response.get( 'stats', {} ).get( 'n_billed', 0 )
         print( "Note that aproximate costs for queries with a time frame within the last 6h may be under-reported.")
         self._logOutput( f"Aproximate cost: ${(thisBilled / self._pricingBlock) / 100}" )
-        self._logOutput( json.dumps( response, indent = 2 ) )
+        self._logOutput( _prettyJson( response ) )
 
     def complete_dryrun( self, text, line, begidx, endidx ):
         return self.complete_q( text, line, begidx, endidx )
@@ -302,8 +311,8 @@ class LCQuery( cmd.Cmd ):
     def do_stats( self, inp ):
         '''Get statistics on the total cost incurred during this session.'''
         self._logOutput( f"Session cost: ${(self._billed / self._pricingBlock) / 100}" )
-        self._logOutput( f"Last query stats: {json.dumps( self._lastStats, indent = 2 )}" )
-        self._logOutput( f"Last D&R rule generated: {json.dumps( self._lastRule, indent = 2 )}" )
+        self._logOutput( f"Last query stats: {_prettyJson( self._lastStats )}" )
+        self._logOutput( f"Last D&R rule generated: {_prettyJson( self._lastRule )}" )
 
     def do_quit( self, inp ):
         '''Quit the LCQL interface.'''
@@ -387,7 +387,7 @@ def main( sourceArgs = None ):
                     events = json.loads( fileContent )
                 except:
                     # This is newline-delimited like you get from LC Outputs.
-                    events = [ json.loads( e ) for e in fileContent.split( '\n' ) ]
+                    events = [ json.loads( e ) for e in fileContent.split( '\n' ) if e.strip() ]
 
                 # If the result is a dictionary and not a list we assume this was
                 # just a single event so we will wrap it.
@@ -149,7 +149,10 @@ class Search( object ):
         with self._mutex:
             print( msg )
 
-def main( sourceArgs = None ):
+# The argument parser is static, build it once per process.
+_parser = None
+
+def _buildParser():
     import argparse
 
     parser = argparse.ArgumentParser( prog = 'limacharlie search' )
@@ -214,7 +217,14 @@ def main( sourceArgs = None ):
                          dest = 'is_per_ioc',
                          help = 'if the search has wildcards, return results grouped per individual ioc.' )
 
-    args = parser.parse_args( sourceArgs )
+    return parser
+
+def main( sourceArgs = None ):
+    global _parser
+    if _parser is None:
+        _parser = _buildParser()
+
+    args = _parser.parse_args( sourceArgs )
 
     search = Search( environments = args.environments, output = args.output )
 
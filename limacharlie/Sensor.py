@@ -58,12 +58,12 @@ class Sensor( object ):
         Returns:
             True if sensor is back or False if timeout
         '''
-        deadline = time.time() + timeout
+        deadline = time.monotonic() + timeout
 
         while not self.isOnline():
-            if time.time() >= deadline:
+            if time.monotonic() >= deadline:
                 return False
-            time.sleep( min( 60, deadline - time.time() ) )
+            time.sleep( min( 60, deadline - time.monotonic() ) )
 
         return True
 
@@ -127,23 +127,19 @@ class Sensor( object ):
         if isinstance( tasks, ( list, tuple ) ):
             nExpectedResponses = len( tasks )
 
-        deadline = time.time() + timeout
+        deadline = time.monotonic() + timeout
 
         # Although getting the command result may take a while, the receipt from the sensor
-        # should come back quickly so we will implement a static wait for that.
-        while True:
-            time.sleep( 1 )
-            if future.wasReceived:
-                break
-            if time.time() > deadline:
-                print("DEADLINE")
-                return None
+        # should come back quickly so we will wait for that first.
+        if not future.waitForReceipt( timeout = max( 0, deadline - time.monotonic() ) ):
+            print("DEADLINE")
+            return None
 
         # We know the sensor got the tasking, now we will wait according to variable timeout.
         allResponses = []
         nDone = 0
         while True:
-            responses = future.getNewResponses( timeout = deadline - time.time() )
+            responses = future.getNewResponses( timeout = deadline - time.monotonic() )
             if not responses:
                 break
             if not until_completion:
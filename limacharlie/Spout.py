@@ -162,7 +162,7 @@ class Spout( object ):
                 for line in self._hConn.iter_lines( chunk_size = 1024 * 1024 * 10 ):
                     try:
                         if self._is_parse:
-                            line = json.loads( line.decode() )
+                            line = json.loads( line )
                             # The output.limacharlie.io service also injects a
                             # few trace messages like keepalives and number of
                             # events dropped (if any) from the server (indicating
@@ -16,6 +16,9 @@ import sys
 import yaml
 import json
 
+# Used to compare configs independently of key order.
+_sortedEncoder = json.JSONEncoder( sort_keys = True )
+
 class LcConfigException( Exception ):
     pass
 
@@ -71,7 +74,9 @@ class Sync( object ):
         return rule
 
     def _isJsonEqual( self, a, b ):
-        if json.dumps( a, sort_keys = True ) != json.dumps( b, sort_keys = True ):
+        if a is b:
+            return True
+        if _sortedEncoder.encode( a ) != _sortedEncoder.encode( b ):
             return False
 
         return True
@@ -14,16 +14,17 @@ class WebhookSender(object):
         self.url = f"https://{hook_url}/{self._manager._oid}/{quote(hook_name)}/{quote(secret_value)}"
         self.client = requests.Session()
         self.client.timeout = 30  # 30 seconds timeout
+        # Every payload is sent the same way, set the headers once.
+        self.client.headers.update({
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+            "User-Agent": "lc-sdk-webhook"
+        })
 
     def send(self, data):
         try:
             b = gzip.compress(json.dumps(data).encode())
-            headers = {
-                "Content-Type": "application/json",
-                "Content-Encoding": "gzip",
-                "User-Agent": "lc-sdk-webhook"
-            }
-            response = self.client.post(self.url, data=b, headers=headers)
+            response = self.client.post(self.url, data=b)
         except Exception as e:
             raise Exception(f"Error sending data: {e}")
 
@@ -29,11 +29,12 @@ def cli():
     # to the proper sub-command line.
     rootArgs = sys.argv[ 1 : 2 ]
     args = parser.parse_args( rootArgs )
+    action = args.action.lower()
 
-    if args.action.lower() == 'version':
+    if action == 'version':
         from . import __version__
         print( "LimaCharlie Python SDK Version %s" % ( __version__, ) )
-    elif args.action.lower() == 'login':
+    elif action == 'login':
         if _IS_PYTHON_2:
             oid = raw_input( 'Enter your Organization ID (UUID): ' ) # noqa
         else:
@@ -85,7 +86,7 @@ def cli():
         os.chown( os.path.expanduser( '~/.limacharlie' ), os.getuid(), os.getgid() )
         os.chmod( os.path.expanduser( '~/.limacharlie' ), stat.S_IWUSR | stat.S_IRUSR )
         print( "Credentials have been stored to: %s" % os.path.expanduser( '~/.limacharlie' ) )
-    elif args.action.lower() == 'use':
+    elif action == 'use':
         parser = argparse.ArgumentParser( prog = 'limacharlie use' )
         parser.add_argument( 'environment_name',
                              type = str,
@@ -115,46 +116,45 @@ def cli():
                 print( "Environment not found" )
                 sys.exit( 1 )
             print( 'export LC_CURRENT_ENV="%s"' % args.environment_name )
-    elif args.action.lower() == 'dr':
+    elif action == 'dr':
         from .DRCli import main as cmdMain
         cmdMain( sys.argv[ 2 : ] )
-    elif args.action.lower() == 'search':
+    elif action == 'search':
         from .Search import main as cmdMain
         cmdMain( sys.argv[ 2 : ] )
-    elif args.action.lower() == 'replay':
+    elif action == 'replay':
         from .Replay import main as cmdMain
         cmdMain( sys.argv[ 2 : ] )
-    elif args.action.lower() == 'query':
+    elif action == 'query':
         from .Query import main as cmdMain
         cmdMain( sys.argv[ 2 : ] )
-    elif args.action.lower() == 'sync':
+    elif action == 'sync':
         from .Sync import main as cmdMain
         cmdMain( sys.argv[ 2 : ] )
-    elif args.action.lower() == 'configs':
+    elif action == 'configs':
         from .Configs import main as cmdMain
         cmdMain( sys.argv[ 2 : ] )
-    elif args.action.lower() == 'spotcheck':
+    elif action == 'spotcheck':
         from .SpotCheck import main as cmdMain
         cmdMain( sys.argv[ 2 : ] )
-    elif args.action.lower() == 'spout':
+    elif action == 'spout':
         from .Spout import main as cmdMain
         cmdMain( sys.argv[ 2 : ] )
-    elif args.action.lower() == 'get-arl':
+    elif action == 'get-arl':
         from .ARL import main as cmdMain
         cmdMain( sys.argv[ 2 : ] )
-    elif args.action.lower() == 'who':
+    elif action == 'who':
         from . import Manager
         tmpManager = Manager()
         print( "OID: %s" % ( tmpManager._oid, ) )
         print( "UID: %s" % ( tmpManager._uid, ) )
         print( "KEY: %s..." % ( tmpManager._secret_api_key[ : 4 ], ) )
         print( "PERMISSIONS:\n%s" % ( yaml.safe_dump( tmpManager.whoAmI() ), ) )
-    elif args.action.lower() == 'logs' or args.action.lower() == 'artifacts':
+    elif action == 'logs' or action == 'artifacts':
         from .Logs import main as cmdMain
         cmdMain( sys.argv[ 2 : ] )
-    elif args.action.lower() == 'detections':
+    elif action == 'detections':
         from . import Manager
-        import json
         parser = argparse.ArgumentParser( prog = 'limacharlie detections' )
         parser.add_argument( 'start',
                              type = int,
@@ -176,9 +176,8 @@ def cli():
         _man = Manager()
         for detection in _man.getHistoricDetections( args.start, args.end, limit = args.limit, cat = args.cat ):
             print( json.dumps( detection ) )
-    elif args.action.lower() == 'events':
+    elif action == 'events':
         from . import Manager
-        import json
         parser = argparse.ArgumentParser( prog = 'limacharlie events' )
         parser.add_argument( 'sid',
                              type = uuid.UUID,
@@ -209,9 +208,8 @@ def cli():
         _sensor = _man.sensor( str( args.sid ) )
         for event in _sensor.getHistoricEvents( args.start, args.end, limit = args.limit, eventType = args.eventType, outputName = args.outputName ):
             print( json.dumps( event ) )
-    elif args.action.lower() == 'audit':
+    elif action == 'audit':
         from . import Manager
-        import json
         parser = argparse.ArgumentParser( prog = 'limacharlie audit' )
         parser.add_argument( 'start',
                              type = int,
@@ -242,18 +240,17 @@ def cli():
         _man = Manager()
         for event in _man.getAuditLogs( args.start, args.end, limit = args.limit, event_type = args.eventType, sid = args.sid ):
             print( json.dumps( event ) )
-    elif args.action.lower() == 'hive':
+    elif action == 'hive':
         from .Hive import main as cmdMain
         cmdMain( sys.argv[ 2 : ] )
-    elif args.action.lower() == 'extension':
+    elif action == 'extension':
         from .Extensions import main as cmdMain
         cmdMain( sys.argv[ 2 : ] )
-    elif args.action.lower() == 'model':
+    elif action == 'model':
         from .Model import main as cmdMain
         cmdMain( sys.argv[ 2 : ] )
-    elif args.action.lower() == 'create_org':
+    elif action == 'create_org':
         from . import Manager
-        import json
         parser = argparse.ArgumentParser( prog = 'limacharlie create_org' )
         parser.add_argument( 'name',
                              type = str,
@@ -267,9 +264,8 @@ def cli():
         _man = Manager()
         res = _man.createNewOrg( args.name, args.loc )
         print( json.dumps( res, indent = 2 ) )
-    elif args.action.lower() == 'schema':
+    elif action == 'schema':
         from . import Manager
-        import json
         parser = argparse.ArgumentParser( prog = 'limacharlie schema' )
         parser.add_argument( '--schema-name',
                              type = str,
@@ -284,13 +280,11 @@ def cli():
         else:
             res = _man.getSchema( name = args.name )
         print( json.dumps( res, indent = 2 ) )
-    elif args.action.lower() == 'org_stats':
+    elif action == 'org_stats':
         from . import Manager
-        import yaml
         print( yaml.dump( Manager().getUsageStats() ) )
-    elif args.action.lower() == 'mass-tag':
+    elif action == 'mass-tag':
         from . import Manager
-        import json
         parser = argparse.ArgumentParser( prog = 'limacharlie mass-tag' )
         parser.add_argument( 'sensor_selector',
                              type = str,
@@ -325,12 +319,11 @@ def cli():
                     sensor.untag( tag )
                     print( "done" )
         print( "all done" )
-    elif args.action.lower() == 'mass-upgrade':
+    elif action == 'mass-upgrade':
         from .versions import massUpgrade
         massUpgrade()
-    elif args.action.lower() == 'sensors':
+    elif action == 'sensors':
         from . import Manager
-        import json
         parser = argparse.ArgumentParser( prog = 'limacharlie sensors' )
         parser.add_argument( '--selector',
                              default = None,
@@ -356,9 +349,8 @@ def cli():
         _man = Manager()
         for sensor in _man.sensors( selector = args.sensor_selector, limit = args.limit, with_ip = args.with_ip, with_hostname_prefix = args.with_hostname_prefix ):
             print( json.dumps( sensor.getInfo(), indent = 2 ) )
-    elif args.action.lower() == 'sensors_with_ip':
+    elif action == 'sensors_with_ip':
         from . import Manager
-        import json
         parser = argparse.ArgumentParser( prog = 'limacharlie sensors_with_ip' )
         parser.add_argument( 'ip',
                              type = str,
@@ -379,10 +371,11 @@ def cli():
             start = args.start
             end = args.end
         else:
-            start = int(time.time() - (4*60*60))
-            end = int(time.time())
+            now = int(time.time())
+            start = now - (4*60*60)
+            end = now
         print( json.dumps( _man.getSensorsWithIp( args.ip, start, end ), indent = 2 ) )
-    elif args.action.lower() == 'mitre-report':
+    elif action == 'mitre-report':
         from . import Manager
         print(json.dumps(Manager().getMITREReport(), indent = 2))
     else:
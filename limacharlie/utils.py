@@ -27,6 +27,7 @@ class FutureResults( object ):
     def __init__( self ):
         self._nReceivedResults = 0
         self._newResultEvent = threading.Event()
+        self._receivedEvent = threading.Event()
         self._results = []
         self._lock = threading.Lock()
         self.wasReceived = False
@@ -35,6 +36,7 @@ class FutureResults( object ):
         with self._lock:
             if 'CLOUD_NOTIFICATION' == res[ 'routing' ][ 'event_type' ]:
                 self.wasReceived = True
+                self._receivedEvent.set()
             else:
                 res = _enhancedDict( res )
                 res[ 'routing' ] = _enhancedDict( res[ 'routing' ] )
@@ -43,6 +45,18 @@ class FutureResults( object ):
                 self._nReceivedResults += 1
                 self._newResultEvent.set()
 
+    def waitForReceipt( self, timeout = None ):
+        '''Wait for the Sensor to acknowledge receiving the task, blocking for up to timeout seconds.
+
+        Args:
+            timeout (float): number of seconds to block for the receipt.
+
+        Returns:
+            True if the receipt was received, False if timeout is reached.
+        '''
+
+        return self._receivedEvent.wait( timeout = timeout )
+
     def getNewResponses( self, timeout = None ):
         '''Get new responses available, blocking for up to timeout seconds.
 
@@ -25,7 +25,8 @@ def massUpgrade():
                             dest='version',
                             help='the version to apply, "latest" or "stable" or "-" or a specific version (like 4.30.0).')
     args=parser.parse_args(sys.argv[2:])
-    if args.version.lower() not in ['latest', 'stable', '-'] and args.sensor_selector:
+    version=args.version.lower()
+    if version not in ['latest', 'stable', '-'] and args.sensor_selector:
         print('Version must be either "latest" or "stable" (or "-" if a sensor selector is specified, or specific version like 4.30.0 if a sensor selector is not specified).')
         return
     if args.version == '-' and not args.sensor_selector:
@@ -38,13 +39,13 @@ def massUpgrade():
     orgs=[]
     for oid in args.orgs:
         if oid == '-':
-            orgs += sys.stdin.read().strip().split('\n')
+            orgs += sys.stdin.read().strip().splitlines()
         else:
             try:
                 uuid.UUID(oid)
             except Exception as e:
                 with open(oid, 'r') as f:
-                    orgs += f.read().strip().split('\n')
+                    orgs += f.read().strip().splitlines()
             else:
                 orgs.append(oid)
     if not orgs:
@@ -57,11 +58,11 @@ def massUpgrade():
             print(f'Invalid org ID: {oid}')
             return
 
-    isFallback=args.version.lower() == 'stable'
+    isFallback=version == 'stable'
     if isFallback:
         print('Applying stable version.')
     else:
-        print(f'Applying {args.version.lower()} version.')
+        print(f'Applying {version} version.')
 
     for oid in orgs:
         print(f'Processing org {oid}')
@@ -79,7 +80,7 @@ def massUpgrade():
                         print(f"Task {sensor.sid} generated an exception: {e}")
         else:
             print(f'Applying to entire org {oid}')
-            if args.version.lower() in ['latest', 'stable']:
+            if version in ['latest', 'stable']:
                 _man.setSensorVersion(isFallbackVersion=isFallback)
             else:
                 _man.setSensorVersion(specificVersion=args.version)
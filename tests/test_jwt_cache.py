@@ -0,0 +1,67 @@
+import limacharlie
+import base64
+import json
+import sys
+import time
+import uuid
+
+# limacharlie.Manager is the class, the module holds the JWT cache.
+_managerModule = sys.modules[ 'limacharlie.Manager' ]
+
+class _FakeResponse( object ):
+    def __init__( self, jwt ):
+        self.content = json.dumps( { 'jwt' : jwt } ).encode()
+
+    def raise_for_status( self ):
+        pass
+
+def _makeJWT( expiresAt ):
+    payload = base64.urlsafe_b64encode( json.dumps( { 'exp' : expiresAt } ).encode() ).decode().rstrip( '=' )
+    return 'header.%s.signature' % ( payload, )
+
+def _newManager( oid, key, calls ):
+    lc = limacharlie.Manager( oid, key )
+
+    def post( *args, **kwargs ):
+        calls.append( args )
+        return _FakeResponse( _makeJWT( time.time() + 3600 ) )
+    lc._session.post = post
+    return lc
+
+def test_jwt_cache_reuse():
+    _managerModule._jwtCache.clear()
+    oid = str( uuid.uuid4() )
+    key = str( uuid.uuid4() )
+    calls = []
+
+    lc1 = _newManager( oid, key, calls )
+    lc2 = _newManager( oid, key, calls )
+    lc1._refreshJWT()
+    lc2._refreshJWT()
+
+    assert( 1 == len( calls ) )
+    assert( lc1._jwt == lc2._jwt )
+
+    # A forced refresh always goes to the API.
+    lc2._refreshJWT( isForceRefresh = True )
+    assert( 2 == len( calls ) )
+
+    # The secret key itself is not kept in the cache.
+    assert( all( key not in k for k in _managerModule._jwtCache ) )
+
+def test_jwt_cache_expired():
+    _managerModule._jwtCache.clear()
+    oid = str( uuid.uuid4() )
+    key = str( uuid.uuid4() )
+    calls = []
+
+    lc = _newManager( oid, key, calls )
+    lc._refreshJWT()
+    assert( 1 == len( calls ) )
+
+    # Entries within the safety margin of expiring are not re-used.
+    for k, v in list( _managerModule._jwtCache.items() ):
+        _managerModule._jwtCache[ k ] = ( v[ 0 ], time.time() + 1 )
+    lc._refreshJWT()
+    assert( 2 == len( calls ) )
+    assert( 1 == len( _managerModule._jwtCache ) )
@@ -16,13 +16,10 @@ def test_spout( oid, key ):
     lc = limacharlie.Manager( oid, key, inv_id = 'test-lc-python-sdk-inv', is_interactive = True )
 
     try:
-        # First we need to make sure we have a sensor to test against.
-        sensors = list( lc.sensors() )
-        assert( 0 != len( sensors ) )
-
-        # We will pick the first sensor in the list that is online.
+        # We will pick the first sensor in the list that is online,
+        # no need to page through the rest of the sensors after that.
         targetSensor = None
-        for sensor in sensors:
+        for sensor in lc.sensors():
             if ( not sensor.isChrome() ) and sensor.isOnline():
                 targetSensor = sensor
                 print( "Found sensor %s online, using it for test." % ( sensor, ) )